@@ -0,0 +1,9 @@
+# Generated by scripts/gen_prime_tables.py - do not edit by hand
+
+# Trial divisors used to cheaply reject the vast majority of composites
+# before running the Miller-Rabin rounds (all primes up to 53)
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53)
+
+# Witnesses for a deterministic Miller-Rabin test. This set is sufficient
+# for all n < 3.3e24, which comfortably covers 64-bit inputs.
+MR_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
@@ -0,0 +1,80 @@
+from functools import lru_cache
+
+from pydantic import BaseModel, Field
+
+from ivcap_service import getLogger, Service
+from ivcap_ai_tool import start_tool_server, ivcap_ai_tool, ToolOptions, logging_init
+
+from _tables import MR_WITNESSES, SMALL_PRIMES
+
+logging_init()
+logger = getLogger("app")
+
+service = Service(
+    name="Prime Number Checker",
+    description= """
+Simple tool to check whether a number is prime.
+""",
+    contact={
+        "name": "Max Ott",
+        "email": "max.ott@data61.csiro.au",
+    },
+    license={
+        "name": "MIT",
+        "url": "https://opensource.org/license/MIT",
+    },
+)
+
+class Request(BaseModel):
+    jschema: str = Field("urn:sd:schema:is-prime.request.1", alias="$schema")
+    number: int = Field(..., description="the number to check for primality")
+
+class Result(BaseModel):
+    jschema: str = Field("urn:sd:schema:is-prime.1", alias="$schema")
+    number: int = Field(..., description="the number checked")
+    is_prime: bool = Field(..., description="true if 'number' is prime")
+
+@lru_cache(maxsize=8192)
+def _is_prime(number: int) -> bool:
+    if number < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if number == p:
+            return True
+        if number % p == 0:
+            return False
+
+    # Factor number - 1 as d * 2^s with d odd
+    d = number - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in MR_WITNESSES:
+        if a % number == 0:
+            continue
+        x = pow(a, d, number)
+        if x == 1 or x == number - 1:
+            continue
+        for _ in range(s - 1):
+            x = pow(x, 2, number)
+            if x == number - 1:
+                break
+        else:
+            return False
+    return True
+
+@ivcap_ai_tool("/", opts=ToolOptions(tags=["Prime Checker"], service_id="/"))
+def is_prime(req: Request) -> Result:
+    """
+    Check whether a number is prime
+
+    Uses a deterministic Miller-Rabin test which only needs O(log n)
+    modular exponentiations instead of the O(sqrt n) divisions a
+    trial-division loop would require.
+    """
+    return Result(number=req.number, is_prime=_is_prime(req.number))
+
+if __name__ == "__main__":
+    start_tool_server(service)
@@ -1,35 +1,69 @@
 from typing import AsyncGenerator, Dict, Optional, Tuple
 from fastapi import FastAPI, Path, Request, Header, Response
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+import asyncio
 import json
 import os
+from time import monotonic
 import uvicorn
 import httpx
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+
+# Shared upstream client so proxied requests reuse pooled keep-alive
+# connections instead of paying a TCP/TLS handshake per request.
+CLIENT = httpx.AsyncClient(
+    timeout=httpx.Timeout(30.0),
+    limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+)
+
+@app.on_event("shutdown")
+async def close_client():
+    await CLIENT.aclose()
 
 TEST_LOAD_PATH = os.path.join(os.path.dirname(__file__), "test_request.json")
 
 from fastapi import Header
 
-@app.middleware("http")
-async def decode_path(request: Request, call_next):
-    path = request.url.path
-    if path.startswith("//ivcap.minikube"):
-        p = path[len('//ivcap.minikube'):]
-        request.scope["path"] = p
-    response = await call_next(request)
-    return response
+class DecodePathMiddleware:
+    """Strip the '//ivcap.minikube' prefix from request paths.
+
+    Implemented as a pure ASGI middleware so requests which don't need
+    the rewrite avoid the Request/coroutine overhead of an HTTP
+    middleware."""
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("//ivcap.minikube"):
+            scope["path"] = scope["path"][len("//ivcap.minikube"):]
+        await self.app(scope, receive, send)
+
+app.add_middleware(DecodePathMiddleware)
+
+# The test job file never changes, so read it once instead of paying
+# file I/O and JSON parsing on every poll of /next_job.
+_cached_job: Optional[bytes] = None
 
 @app.get("/next_job")
-async def next_job():
-    try:
-        with open(TEST_LOAD_PATH, "r") as f:
-            content = json.load(f)
-        headers = {"job-id": "0000-0000", "Authorization": "Bearer xxxxx"}
-        return JSONResponse(content, headers=headers)
-    except FileNotFoundError:
-        return JSONResponse({"error": "test_load.json not found"}, status_code=404)
+async def next_job(wait: int = 0):
+    """Return the next job. With `?wait=N` the request long-polls for up
+    to N seconds until a job is available, so idle workers hold one
+    connection instead of spinning on retries."""
+    global _cached_job
+    deadline = monotonic() + wait
+    while _cached_job is None:
+        try:
+            with open(TEST_LOAD_PATH, "rb") as f:
+                _cached_job = f.read()
+        except FileNotFoundError:
+            if monotonic() < deadline:
+                await asyncio.sleep(0.5)
+                continue
+            return ORJSONResponse({"error": "test_load.json not found"}, status_code=404)
+    headers = {"job-id": "0000-0000", "Authorization": "Bearer xxxxx"}
+    return Response(content=_cached_job, media_type="application/json", headers=headers)
 
 @app.post("/results/{job_id}")
 async def results(job_id: str, request: Request):
@@ -42,7 +76,10 @@ async def results(job_id: str, request: Request):
     print(json.dumps(data, indent=4))
     return {"status": "received"}
 
-SAFE_HEADERS = {
+# Headers never forwarded to the upstream service
+EXCLUDED_HEADERS = frozenset({"ivcap-forward-url", "ivcap-job-id", "host"})
+
+SAFE_HEADERS = frozenset({
     "content-type",
     "content-encoding",
     "content-length",
@@ -51,7 +88,24 @@ SAFE_HEADERS = {
     "last-modified",
     "expires",
     "vary"
-}
+})
+
+async def _proxy(method: str, url: str, headers: Dict[str, str], content: Optional[bytes] = None) -> StreamingResponse:
+    """Forward a request to `url` and stream the upstream response back
+    without buffering it in memory."""
+    upstream_request = CLIENT.build_request(method, url, headers=headers, content=content)
+    upstream = await CLIENT.send(upstream_request, stream=True)
+
+    # ⚠️ streaming the raw bytes bypasses automatic decompression
+    return StreamingResponse(
+        upstream.aiter_raw(),
+        status_code=upstream.status_code,
+        headers={
+            k: v for k, v in upstream.headers.items()
+            if k.lower() in SAFE_HEADERS
+        },
+        background=BackgroundTask(upstream.aclose),
+    )
 
 @app.get("/proxy")
 async def proxy_get(request: Request, ivcap_forward_url: str = Header(None), ivcap_job_id: str = Header(None)):
@@ -59,56 +113,35 @@ async def proxy_get(request: Request, ivcap_forward_url: str = Header(None), ivc
     Proxies a GET request to the URL specified in the X-Proxy-Url header.
     """
     if not ivcap_forward_url:
-        return JSONResponse({"error": "Ivcap-Forward-Url header is required"}, status_code=400)
+        return ORJSONResponse({"error": "Ivcap-Forward-Url header is required"}, status_code=400)
 
-    headers_to_forward = {}
-    for key, value in request.headers.items():
-        if key.lower() not in ("ivcap-forward-url", "ivcap-job-id", "host"):
-            headers_to_forward[key] = value
+    headers_to_forward = {
+        k: v for k, v in request.headers.items() if k.lower() not in EXCLUDED_HEADERS
+    }
 
     print(f"Proxying request for {ivcap_job_id} to: '{ivcap_forward_url}' with headers: {headers_to_forward}")
 
-    async with httpx.AsyncClient() as client:
-        async with client.stream("GET", ivcap_forward_url, headers=headers_to_forward) as upstream:
-            # ⚠️ this bypasses automatic decompression
-            content = b"".join([chunk async for chunk in upstream.aiter_raw()])
-            # Filter headers
-            headers = {
-                k: v for k, v in upstream.headers.items()
-                if k.lower() in SAFE_HEADERS
-            }
-
-            return Response(content=content, headers=headers, status_code=upstream.status_code)
+    return await _proxy("GET", ivcap_forward_url, headers_to_forward)
 
 @app.post("/proxy")
 async def proxy_post(request: Request, ivcap_forward_url: str = Header(None), ivcap_job_id: str = Header(None)):
     """
-    Proxies a GET request to the URL specified in the X-Proxy-Url header.
+    Proxies a POST request to the URL specified in the X-Proxy-Url header.
     """
     if not ivcap_forward_url:
-        return JSONResponse({"error": "Ivcap-Forward-Url header is required"}, status_code=400)
+        return ORJSONResponse({"error": "Ivcap-Forward-Url header is required"}, status_code=400)
 
-    headers_to_forward = {}
-    for key, value in request.headers.items():
-        if key.lower() not in ("ivcap-forward-url", "ivcap-job-id", "host"):
-            headers_to_forward[key] = value
+    headers_to_forward = {
+        k: v for k, v in request.headers.items() if k.lower() not in EXCLUDED_HEADERS
+    }
 
     print(f"Proxying request for {ivcap_job_id} to: '{ivcap_forward_url}' with headers: {headers_to_forward}")
     body = await request.body()  # Await the body and store it
-    async with httpx.AsyncClient() as client:
-        async with client.stream("POST", ivcap_forward_url, data=body, headers=headers_to_forward) as upstream:
-            # ⚠️ this bypasses automatic decompression
-            content = b"".join([chunk async for chunk in upstream.aiter_raw()])
-            # Filter headers
-            headers = {
-                k: v for k, v in upstream.headers.items()
-                if k.lower() in SAFE_HEADERS
-            }
-
-            return Response(content=content, headers=headers, status_code=upstream.status_code)
+
+    return await _proxy("POST", ivcap_forward_url, headers_to_forward, content=body)
 
 #app.get("/proxy")(proxy)
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=9999)
+    uvicorn.run(app, host="0.0.0.0", port=9999, loop="uvloop", http="httptools")
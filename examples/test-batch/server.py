@@ -1,8 +1,5 @@
 
-from dataclasses import dataclass
-import io
-import json
-import time
+import asyncio
 import traceback
 from typing import BinaryIO, Callable, Union
 import argparse
@@ -11,68 +8,110 @@ from typing import Any, Callable, Dict, Optional
 from urllib.parse import urlparse, urlunparse
 from fastapi import FastAPI, Request, Response
 import httpx
+import orjson
 import uvicorn
 import os
 import sys
 import signal
-from pydantic import BaseModel, Field
-import requests  # Import the requests library
+from pydantic import BaseModel
 
 from ivcap_fastapi import service_log_config, getLogger
+
+from ivcap_common import (
+    BinaryResult, IvcapResult, ExecutionError, push_result, get_ivcap_url,
+)
 # Number of attempt to request a new job before giving up
 MAX_REQUEST_JOB_ATTEMPTS = 4
 
-def wait_for_work(worker_fn: Callable, input_model: type[BaseModel], output_model: type[BaseModel], logger: Logger):
+# Number of jobs worked on concurrently; the example workload is
+# CPU-bound so one thread per core is appropriate
+MAX_CONCURRENT_JOBS = os.cpu_count() or 1
+
+# Ask the sidecar to hold the /next_job request open for up to this many
+# seconds when no job is available (long-polling)
+NEXT_JOB_WAIT_TIME = 30
+
+async def wait_for_work(worker_fn: Callable, input_model: type[BaseModel], output_model: type[BaseModel], logger: Logger):
+    """Run the fetch/work/post pipeline until the sidecar reports no more jobs.
+
+    Jobs are fetched, worked on and their results posted by separate
+    coroutines connected through queues, so network latency of one stage
+    overlaps with compute in another instead of everything running
+    serially. The worker function itself runs in threads via
+    `asyncio.to_thread`, bounded by MAX_CONCURRENT_JOBS.
+    """
     ivcap_url = get_ivcap_url()
     if ivcap_url is None:
         logger.warning(f"no ivcap url found - cannot request work")
         return
     url = urlunparse(ivcap_url._replace(path=f"/next_job"))
     logger.info(f"... checking for work at '{url}'")
-    try:
 
-        while True:
-            result = None
-            try:
-                response = fetch_job(url, logger)
+    job_queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_CONCURRENT_JOBS)
+    result_queue: asyncio.Queue = asyncio.Queue()
+
+    async with httpx.AsyncClient() as client:
+        async def fetcher():
+            while True:
+                response = await fetch_job(client, url, logger)
                 job = response.json()
                 schema = job.get("$schema", "")
                 if schema.startswith("urn:ivcap:schema.service.batch.done"):
                     logger.info("no more jobs - we are done")
-                    sys.exit(0)
-
+                    for _ in range(MAX_CONCURRENT_JOBS):
+                        await job_queue.put(None)  # one stop marker per worker
+                    return
+                await job_queue.put(job)
+
+        async def worker():
+            while True:
+                job = await job_queue.get()
+                if job is None:
+                    await result_queue.put(None)
+                    return
                 job_id = job.get("id", "unknown_job_id")  # Provide a default value if "id" is missing
-                result = do_job(job, worker_fn, input_model, output_model, logger)
-                result = verify_result(result, job_id, logger)
-            except Exception as e:
-                result = ExecutionError(
-                    error=str(e),
-                    type=type(e).__name__,
-                    traceback=traceback.format_exc()
-                )
-                logger.warning(f"job {job_id} failed - {result.error}")
-            finally:
-                if result is not None:
-                    logger.info(f"job {job_id} finished, sending result message")
-                    push_result(result, job_id, None, logger)
-
-    except requests.exceptions.RequestException as e:
-        logger.warning(f"Error during request: {e}")
-    except Exception as e:
-        logger.warning(f"Error processing job: {e}")
-
-def fetch_job(url: str, logger: Logger) -> Any:
+                try:
+                    result = await asyncio.to_thread(do_job, job, worker_fn, input_model, output_model, logger)
+                    result = verify_result(result, job_id, logger)
+                except Exception as e:
+                    result = ExecutionError(
+                        error=str(e),
+                        type=type(e).__name__,
+                        traceback=traceback.format_exc()
+                    )
+                    logger.warning(f"job {job_id} failed - {result.error}")
+                await result_queue.put((job_id, result))
+
+        async def poster():
+            stopped_workers = 0
+            while stopped_workers < MAX_CONCURRENT_JOBS:
+                item = await result_queue.get()
+                if item is None:
+                    stopped_workers += 1
+                    continue
+                job_id, result = item
+                logger.info(f"job {job_id} finished, sending result message")
+                await push_result(client, result, job_id, None, logger)
+
+        try:
+            await asyncio.gather(fetcher(), *(worker() for _ in range(MAX_CONCURRENT_JOBS)), poster())
+        except httpx.HTTPError as e:
+            logger.warning(f"Error during request: {e}")
+        except Exception as e:
+            logger.warning(f"Error processing job: {e}")
+
+async def fetch_job(client: httpx.AsyncClient, url: str, logger: Logger) -> Any:
     wait_time = 1
     attempt = 0
     while attempt < MAX_REQUEST_JOB_ATTEMPTS:
         try:
-            response = requests.get(url)
+            response = await client.get(url, params={"wait": NEXT_JOB_WAIT_TIME}, timeout=NEXT_JOB_WAIT_TIME + 5)
             response.raise_for_status()
             return response
         except Exception as e:
             attempt += 1
             logger.info(f"attempt #{attempt} failed to fetch new job - will try again in {wait_time} sec - {type(e)}: {e}")
-            time.sleep(wait_time)
+            await asyncio.sleep(wait_time)
             wait_time *= 2
     logger.info("cannot contact sidecar - bailing out")
     sys.exit(255)
@@ -147,37 +186,26 @@ def start_service(
         resp = file_to_http_response(args.test_file, headers={"Content-Type": "application/json"})
         do_job(resp, worker_fn, input_model, output_model, logger)
     else:
-        wait_for_work(worker_fn, input_model, output_model, logger)
-
-##### COMMON TO executor
-
-# Number of attempt to deliver job result before giving up
-MAX_DELIVER_RESULT_ATTEMPTS = 4
-
-@dataclass
-class BinaryResult():
-    """If the result of the tool is a non json serialisable object, return an
-    instance of this class indicating the content-type and the actual
-    result either as a byte array or a file handle to a binary content (`open(..., "rb")`)"""
-    content_type: str = Field(description="Content type of result serialised")
-    content: Union[bytes, str, io.BufferedReader] = Field(description="Content to send, either as byte array or file handle")
-
-@dataclass
-class IvcapResult(BinaryResult):
-    isError: bool = False
-    raw: Any = None
-
-class ExecutionError(BaseModel):
-    """
-    Pydantic model for execution errors.
-    """
-    jschema: str = Field("urn:ivcap:schema.ai-tool.error.1", alias="$schema")
-    error: str = Field(description="Error message")
-    type: str = Field(description="Error type")
-    traceback: Optional[str] = Field(None, description="traceback")
-
+        asyncio.run(wait_for_work(worker_fn, input_model, output_model, logger))
+
+##### COMMON TO executor (shared with ivcap.py via ivcap_common.py)
+
+# Handlers for the exact result types seen on the hot per-job path. A
+# dict lookup on type(result) avoids walking the full isinstance chain
+# for the common cases; subclasses fall through to the MRO-based checks
+# in verify_result.
+_RESULT_HANDLERS = {
+    ExecutionError: lambda result, job_id, logger: result,
+    str: lambda result, job_id, logger: IvcapResult(
+        content=result, content_type="text/plain", raw=result),
+    bytes: lambda result, job_id, logger: IvcapResult(
+        content=result, content_type="application/octet-stream", raw=result),
+}
 
 def verify_result(result: any, job_id: str, logger) -> any:
+    handler = _RESULT_HANDLERS.get(type(result))
+    if handler is not None:
+        return handler(result, job_id, logger)
     if isinstance(result, ExecutionError):
         return result
     if isinstance(result, BaseModel):
@@ -197,15 +225,6 @@ def verify_result(result: any, job_id: str, logger) -> any:
             )
     if isinstance(result, BinaryResult):
         return IvcapResult(content=result.content, content_type=result.content_type)
-    if isinstance(result, str):
-        return IvcapResult(content=result, content_type="text/plain", raw=result)
-    if isinstance(result, bytes):
-        # If it's a byte array, return it as is
-        return IvcapResult(
-            content=result,
-            content_type="application/octet-stream",
-            raw=result,
-        )
     if isinstance(result, BinaryIO):
         # If it's a file handler, return it as is
         return IvcapResult(
@@ -216,7 +235,7 @@ def verify_result(result: any, job_id: str, logger) -> any:
     # normal model which should be serialisable
     try:
         result = IvcapResult(
-            content=json.dumps(result),
+            content=orjson.dumps(result),
             content_type="application/json"
         )
     except Exception as ex:
@@ -226,71 +245,11 @@ def verify_result(result: any, job_id: str, logger) -> any:
             error=msg,
             type=type(ex).__name__,
         )
-
-def push_result(result: any, job_id: str, authorization: str, logger):
-    """Actively push result to sidecar, fail quietly."""
-    ivcap_url = get_ivcap_url()
-    if ivcap_url is None:
-        logger.warning(f"{job_id}: no ivcap url found - cannot push result")
-        return
-    url = urlunparse(ivcap_url._replace(path=f"/results/{job_id}"))
-
-    content_type="text/plain"
-    content="SOMETHING WENT WRONG _ PLEASE REPORT THIS ERROR"
-    is_error = False
-    if not (isinstance(result, ExecutionError) or isinstance(result, IvcapResult)):
-        msg = f"{job_id}: expected 'BinaryResult' or 'ExecutionError' but got {type(result)}"
-        logger.warning(msg)
-        result = ExecutionError(
-            error=msg,
-            type='InternalError',
-        )
-
-    if isinstance(result, IvcapResult):
-        content = result.content
-        content_type = result.content_type
-    else:
-        is_error = True
-        if not isinstance(result, ExecutionError):
-            # this should never happen
-            logger.error(f"{job_id}: expected 'ExecutionError' but got {type(result)}")
-            result = ExecutionError(
-                error="please report unexpected internal error - expected 'ExecutionError' but got {type(result)}",
-                type="internal_error",
-            )
-        content = result.model_dump_json(by_alias=True)
-        content_type = "application/json"
-
-
-    wait_time = 1
-    attempt = 0
-    headers = {
-        "Content-Type": content_type,
-        "Is-Error": str(is_error),
-    }
-    if not (authorization == None or authorization == ""):
-        headers["Authorization"] = authorization
-
-    while attempt < MAX_DELIVER_RESULT_ATTEMPTS:
-        try:
-            response = httpx.post(
-                url=url,
-                headers=headers,
-                data=content,
-            )
-            response.raise_for_status()
-            return
-        except Exception as e:
-            attempt += 1
-            logger.info(f"{job_id}: attempt #{attempt} failed to push result - will try again in {wait_time} sec - {type(e)}: {e}")
-            time.sleep(wait_time)
-            wait_time *= 2
-
-    logger.warning(f"{job_id}: giving up pushing result after {attempt} attempts")
-
+    return result
 
 ##### COMMON TO ai-tool
 
+import functools
 import inspect
 import os
 import re
@@ -301,9 +260,13 @@ from pydantic import BaseModel, HttpUrl
 def get_version():
     return "???"
 
+@functools.lru_cache(maxsize=None)
 def _get_input_type(func: Callable) -> Tuple[Optional[Type[BaseModel]], Dict[str, Any]]:
     """Gets the input type of a function.
 
+    The result is cached as `inspect.signature`/`get_type_hints` re-resolve
+    all annotations on every call.
+
     Args:
         func: The function to get the input type for.
 
@@ -315,24 +278,20 @@ def _get_input_type(func: Callable) -> Tuple[Optional[Type[BaseModel]], Dict[str
     signature = inspect.signature(func)
     type_hints = get_type_hints(func)
 
-    # Get the Pydantic model class
+    # Single pass: pick up the first pydantic model parameter and collect
+    # all remaining ones as additional parameters
     pydantic_model_class = None
-    pydantic_param_name = None
-    for param_name, param in signature.parameters.items():
-        if hasattr(param.annotation, '__mro__') and BaseModel in param.annotation.__mro__:
-            pydantic_model_class = param.annotation
-            pydantic_param_name = param_name
-            break
-
-    # Get all additional parameters
     additional_params = {}
     for param_name, param in signature.parameters.items():
-        if param_name != pydantic_param_name:
-            param_type = type_hints.get(param_name, Any)
-            additional_params[param_name] = param_type
+        if (pydantic_model_class is None
+                and hasattr(param.annotation, '__mro__') and BaseModel in param.annotation.__mro__):
+            pydantic_model_class = param.annotation
+        else:
+            additional_params[param_name] = type_hints.get(param_name, Any)
 
     return pydantic_model_class, additional_params
 
+@functools.lru_cache(maxsize=None)
 def _get_function_return_type(func):
     """Extracts the return type from a function."""
     type_hints = get_type_hints(func)
@@ -341,11 +300,3 @@ def _get_function_return_type(func):
     # return param_types, return_type
     return return_type
 
-def get_ivcap_url() -> HttpUrl:
-    """
-    Returns the sidecar URL from the request headers.
-    """
-    base = os.getenv("IVCAP_BASE_URL")
-    if base == "":
-        return None
-    return urlparse(base)
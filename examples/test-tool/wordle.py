@@ -23,6 +23,29 @@ WORD_LIST = [
     "UNDER", "VITAL", "WHOLE", "YOUNG", "ZEBRA"
 ]
 
+def _word_masks_for(words):
+    """Per word: a 26-bit letter-presence mask and the letter codes
+    (0-25) per position, so filtering can use integer bit operations
+    instead of nested character loops."""
+    return {
+        word: (sum(1 << (ord(c) - 65) for c in set(word)),
+               tuple(ord(c) - 65 for c in word))
+        for word in words
+    }
+
+# Normalised word list and its masks, computed once at import time so
+# every WordleSolver built from the global list starts in O(1) instead
+# of re-validating and re-encoding the same words per game.
+_ALL_WORDS = tuple(word.upper() for word in WORD_LIST if len(word) == 5 and word.isalpha())
+_ALL_WORD_MASKS = _word_masks_for(_ALL_WORDS)
+_ALL_WORDS_SET = frozenset(_ALL_WORDS)
+
+# First guess strategy: good starting words chosen for having common
+# letters (vowels, S, T, R, N, E, A, I, O). The pick only depends on
+# the word list, so resolve it once per list instead of per game.
+_GOOD_STARTERS = ("CRANE", "ADIEU", "SLATE", "RAISE", "TRASH")
+_FIRST_GUESS = next((s for s in _GOOD_STARTERS if s in _ALL_WORDS), None)
+
 # --- WordleGame Class (Simulating the Wordle Game's Behavior) ---
 class WordleGame:
     def __init__(self, secret_word):
@@ -46,24 +69,25 @@ class WordleGame:
         self.guesses_made.append(guess)
 
         feedback = [''] * 5 # Initialize feedback list
-        secret_word_counts = {}
 
-        # Populate counts of letters in the secret word
+        # Letter counts as a flat 26-slot array indexed by letter code;
+        # cheaper than a dict of single-character keys
+        secret_word_counts = bytearray(26)
         for char in self.secret_word:
-            secret_word_counts[char] = secret_word_counts.get(char, 0) + 1
+            secret_word_counts[ord(char) - 65] += 1
 
         # First pass: Identify Green letters and decrement counts
         for i in range(5):
             if guess[i] == self.secret_word[i]:
                 feedback[i] = 'G' # Green
-                secret_word_counts[guess[i]] -= 1
+                secret_word_counts[ord(guess[i]) - 65] -= 1
 
         # Second pass: Identify Yellow and Gray letters
         for i in range(5):
             if feedback[i] == '': # Only process if not already marked Green
-                if guess[i] in self.secret_word and secret_word_counts.get(guess[i], 0) > 0:
+                if secret_word_counts[ord(guess[i]) - 65] > 0:
                     feedback[i] = 'Y' # Yellow
-                    secret_word_counts[guess[i]] -= 1
+                    secret_word_counts[ord(guess[i]) - 65] -= 1
                 else:
                     feedback[i] = 'X' # Gray
 
@@ -86,8 +110,19 @@ class WordleSolver:
         """
         Initializes the solver with a list of all possible words.
         """
-        self.all_words = [word.upper() for word in word_list if len(word) == 5 and word.isalpha()]
+        if word_list is WORD_LIST:
+            # The common case: reuse the module-level precomputed data
+            self.all_words = list(_ALL_WORDS)
+            self._word_masks = _ALL_WORD_MASKS
+            self.all_words_set = _ALL_WORDS_SET
+            self._first_guess = _FIRST_GUESS
+        else:
+            self.all_words = [word.upper() for word in word_list if len(word) == 5 and word.isalpha()]
+            self._word_masks = _word_masks_for(self.all_words)
+            self.all_words_set = frozenset(self.all_words)
+            self._first_guess = next((s for s in _GOOD_STARTERS if s in self.all_words), None)
         self.possible_words = list(self.all_words) # Solver's current set of candidates
+        self._is_first_guess = True
 
         # Solver's knowledge state:
         self.known_greens = [''] * 5 # e.g., ['', '', 'A', '', ''] means 'A' is 3rd letter
@@ -101,7 +136,13 @@ class WordleSolver:
         Updates the solver's knowledge and filters the list of possible words
         based on the provided guess and its feedback.
         """
-        new_possible_words = []
+        self._is_first_guess = False
+
+        # Snapshot the knowledge so we can tell whether this feedback
+        # actually taught us anything new
+        prev_greens = list(self.known_greens)
+        prev_yellows = [set(s) for s in self.known_yellows]
+        prev_grays = set(self.known_grays)
 
         # Step 1: Update known information based on the latest feedback
         for i, (char_guess, fb_code) in enumerate(zip(guess, feedback)):
@@ -123,38 +164,49 @@ class WordleSolver:
                 if not is_known_present_elsewhere:
                     self.known_grays.add(char_guess)
 
-        # Step 2: Filter `possible_words` based on the updated knowledge
+        # The candidate list was already filtered against the previous
+        # knowledge; if this feedback taught us nothing new, re-filtering
+        # would return the identical list, so skip it
+        if (self.known_greens == prev_greens
+                and self.known_yellows == prev_yellows
+                and self.known_grays == prev_grays):
+            self.feedback_history.append((guess, feedback))
+            return
+
+        # Step 2: Compile the knowledge into bitmasks, then filter
+        # `possible_words` with a few integer operations per word:
+        # - include_mask: letters which must appear somewhere (greens + yellows)
+        # - exclude_mask: letters which must not appear at all (grays)
+        # - allowed[i]: letters still permitted at position i (a single
+        #   green letter, or anything except the yellows seen there)
+        include_mask = 0
+        exclude_mask = 0
+        allowed = [(1 << 26) - 1] * 5
+        for i in range(5):
+            green = self.known_greens[i]
+            if green != '':
+                bit = 1 << (ord(green) - 65)
+                include_mask |= bit
+                allowed[i] = bit
+            for yellow_char in self.known_yellows[i]:
+                bit = 1 << (ord(yellow_char) - 65)
+                include_mask |= bit
+                allowed[i] &= ~bit
+        for char_gray in self.known_grays:
+            exclude_mask |= 1 << (ord(char_gray) - 65)
+
+        word_masks = self._word_masks
+        new_possible_words = []
         for word in self.possible_words:
-            is_valid = True
-
-            # Rule A: Check greens (must match known green letters at specific positions)
-            for i in range(5):
-                if self.known_greens[i] != '' and word[i] != self.known_greens[i]:
-                    is_valid = False
-                    break
-            if not is_valid: continue
-
-            # Rule B: Check yellows (must contain the yellow letter, but NOT at the yellow's position)
-            for i in range(5):
-                for yellow_char in self.known_yellows[i]:
-                    if yellow_char not in word: # Word must contain the yellow letter
-                        is_valid = False
-                        break
-                    if word[i] == yellow_char: # Word must NOT have yellow letter at this position
-                        is_valid = False
-                        break
-                if not is_valid: break
-            if not is_valid: continue
-
-            # Rule C: Check grays (must not contain any known gray letters)
-            # This accounts for letters that were completely ruled out.
-            for char_gray in self.known_grays:
-                if char_gray in word:
-                    is_valid = False
-                    break
-            if not is_valid: continue
-
-            # If all rules pass, the word is still a possibility
+            letters, codes = word_masks[word]
+            if letters & exclude_mask:
+                continue
+            if letters & include_mask != include_mask:
+                continue
+            if not (allowed[0] >> codes[0] & 1 and allowed[1] >> codes[1] & 1
+                    and allowed[2] >> codes[2] & 1 and allowed[3] >> codes[3] & 1
+                    and allowed[4] >> codes[4] & 1):
+                continue
             new_possible_words.append(word)
 
         self.possible_words = new_possible_words
@@ -167,13 +219,9 @@ class WordleSolver:
         if not self.possible_words:
             return None # Solver has no more words to guess
 
-        if len(self.possible_words) == len(self.all_words):
-            # First guess strategy: Use a good starting word if available in the list.
-            # These words are chosen for having common letters (vowels, S, T, R, N, E, A, I, O)
-            good_starters = ["CRANE", "ADIEU", "SLATE", "RAISE", "TRASH"]
-            for starter in good_starters:
-                if starter in self.possible_words:
-                    return starter
+        if self._is_first_guess:
+            if self._first_guess is not None:
+                return self._first_guess
             # Fallback for first guess if no good starter is in the list
             return random.choice(self.possible_words)
 
@@ -219,7 +267,7 @@ def play_wordle_with_solver(secret_word, props: WordleProps) -> WordleResult:
             break
 
         # Ensure the guess is from the allowed list (important if `get_next_guess` was more complex)
-        if guess not in solver.all_words:
+        if guess not in solver.all_words_set:
              logger.warning(f"Solver attempted to guess '{guess}' which is not in its known word list. Skipping.")
              continue # Or handle as an error / penalize attempt
 
@@ -7,13 +7,21 @@ import asyncio
 from dataclasses import dataclass
 import json
 from fastapi import FastAPI, Response, status, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import Any, Dict, List, Optional, Callable, Tuple, Type, TypeVar
-from uuid6 import uuid6
+import uuid
+
+from functools import lru_cache
 
 from ivcap_service import getLogger, get_function_return_type, get_input_type, create_tool_definition
 from ivcap_service import IvcapResult, ToolDefinition, ExecutionError
 
+# Both functions re-resolve all type annotations via inspect on every
+# call but their result is fixed per worker function, so cache them
+get_input_type = lru_cache(maxsize=None)(get_input_type)
+get_function_return_type = lru_cache(maxsize=None)(get_function_return_type)
+
 from .executor import ExecutionContext, Executor, ExecutorOpts
 from .utils import get_title_from_path, get_public_url_prefix
 
@@ -103,28 +111,62 @@ def add_tool_api_route(
             def_name = "Execute the tool"
         opts.name = def_name
 
+    # resolve the worker function's signature and docstring once and
+    # hand the pieces to the individual route builders
+    input = get_input_type(worker_fn)
+    input_model, _ = input
     output_model = get_function_return_type(worker_fn)
-    executor = Executor[output_model](worker_fn, opts=opts.executor_opts, context=context)
+    # tolerate workers without a docstring
+    doc = (worker_fn.__doc__ or "").strip()
+    summary, _, description = doc.partition("\n")
+
+    executor = Executor(worker_fn, output_model=output_model, opts=opts.executor_opts, context=context)
+
+    # normalise once: empty for the root prefix, no trailing slash
+    # otherwise, so job paths can be assembled with a single f-string
+    jobs_prefix = path_prefix.rstrip("/")
+
+    # the 204 'try later' headers are fixed per route except for Location
+    try_later_headers = {
+        "Retry-Later": str(opts.refresh_interval),
+        "Ivcap-Self-Report-Result": "true",
+    }
 
     tools.append(ToolDescription(name=worker_fn.__name__,
                                 path_prefix=path_prefix,
                                 worker_fn=worker_fn,
-                                input=get_input_type(worker_fn),
+                                input=input,
                                 executor=executor))
 
-    _add_do_job_route(app, path_prefix, worker_fn, executor, opts)
-    _add_get_job_route(app, path_prefix, worker_fn, executor, opts)
+    _add_do_job_route(app, path_prefix, jobs_prefix, input_model, output_model, summary, description, executor, opts, try_later_headers)
+    _add_get_job_route(app, jobs_prefix, output_model, executor, opts, try_later_headers)
     _add_get_tool_def_route(app, path_prefix, worker_fn, opts)
 
-def _add_do_job_route(app: FastAPI, path_prefix: str, worker_fn: Callable, executor: Executor, opts: ToolOptions):
-    input_model, _ = get_input_type(worker_fn)
-    output_model = get_function_return_type(worker_fn)
-    summary, description = (worker_fn.__doc__.lstrip() + "\n").split("\n", 1)
+    # warm pydantic's (internally cached) schema build at registration
+    # so the first request or /openapi.json hit doesn't pay for it; the
+    # return annotation may be a plain type (e.g. dict or str)
+    if input_model is not None:
+        input_model.model_json_schema()
+    if isinstance(output_model, type) and issubclass(output_model, BaseModel):
+        output_model.model_json_schema()
 
+def _add_do_job_route(
+    app: FastAPI,
+    path_prefix: str,
+    jobs_prefix: str,
+    input_model: Type[BaseModel],
+    output_model: Type[BaseModel],
+    summary: str,
+    description: str,
+    executor: Executor,
+    opts: ToolOptions,
+    try_later_headers: Dict[str, str],
+):
     async def route(data: input_model, req: Request) -> output_model:  # type: ignore
         job_id = req.headers.get("job-id")
         if job_id == None:
-            job_id = str(uuid6())
+            # uuid4 avoids uuid6's monotonic-timestamp lock on the request path
+            job_id = uuid.uuid4().hex
         elif job_id.startswith(JOB_URN_PREFIX):
             job_id = job_id[len(JOB_URN_PREFIX):]
 
@@ -136,17 +178,20 @@ def _add_do_job_route(app: FastAPI, path_prefix: str, worker_fn: Callable, execu
                 timeout = int(toh)
             else:
                 timeout = opts.max_wait_time
-        logger.info(f"starting job {path_prefix}/jobs/{job_id} - timeout: {timeout} seconds")
+        logger.info("starting job %s/jobs/%s - timeout: %s seconds", jobs_prefix, job_id, timeout)
 
-        queue = await executor.execute(data, job_id, req)
+        fut = await executor.execute(data, job_id, req)
+        if fut.done():
+            # very short job - no need to set up a timeout
+            return _return_job_result(fut.result(), job_id)
         try:
-            el = await asyncio.wait_for(queue.get(), timeout=timeout)
-            queue.task_done()
-            el = _return_job_result(el, job_id)
-            return el
+            # shield the future so a timeout doesn't cancel the job's
+            # result delivery - it is still collectable via GET later
+            el = await asyncio.wait_for(asyncio.shield(fut), timeout=timeout)
+            return _return_job_result(el, job_id)
         except asyncio.TimeoutError:
-            logger.info(f"... defer job result to later - {job_id}")
-            return _return_try_later(job_id, path_prefix, opts)
+            logger.info("... defer job result to later - %s", job_id)
+            return _return_try_later(job_id, jobs_prefix, try_later_headers)
 
     responses = {
         204: {
@@ -173,31 +218,42 @@ def _add_do_job_route(app: FastAPI, path_prefix: str, worker_fn: Callable, execu
         methods=["POST"],
         responses=responses,
         tags=opts.tags,
+        response_class=ORJSONResponse,
         response_model_exclude_none=True,
         response_model_by_alias=True,
         **opts.post_route_opts,
     )
 
-def _add_get_job_route(app: FastAPI, path_prefix: str, worker_fn: Callable, executor: Executor, opts: ToolOptions):
-    output_model = get_function_return_type(worker_fn)
-    def route(job_id: str) -> output_model: # type: ignore
+def _add_get_job_route(app: FastAPI, jobs_prefix: str, output_model: Type[BaseModel], executor: Executor, opts: ToolOptions, try_later_headers: Dict[str, str]):
+    async def route(job_id: str) -> output_model: # type: ignore
         if job_id.startswith(JOB_URN_PREFIX):
             job_id = job_id[len(JOB_URN_PREFIX):]
         try:
-            result = executor.lookup_job(job_id)
-            if result == None:
-                return _return_try_later(job_id, path_prefix, opts)
-            return _return_job_result(result, job_id)
+            result = executor.lookup_job_future(job_id)
         except KeyError:
             return Response(status_code=status.HTTP_404_NOT_FOUND,
                             content=f"job {job_id} can't be found. It either never existed or its result is no longer cached.")
+        if isinstance(result, asyncio.Future):
+            # still running - wait for it briefly so a poller picks up
+            # the result the moment it arrives instead of needing yet
+            # another round trip
+            try:
+                el = await asyncio.wait_for(asyncio.shield(result), timeout=opts.max_wait_time)
+                return _return_job_result(el, job_id)
+            except asyncio.TimeoutError:
+                return _return_try_later(job_id, jobs_prefix, try_later_headers)
+            except (ValueError, RuntimeError):
+                # the future belongs to a different event loop than the
+                # one serving this request - fall back to plain polling
+                return _return_try_later(job_id, jobs_prefix, try_later_headers)
+        if result == None:
+            return _return_try_later(job_id, jobs_prefix, try_later_headers)
+        return _return_job_result(result, job_id)
 
     responses = {
         400: { "model": ErrorModel, },
     }
-    path = "/jobs/" + "{job_id}"
-    if path_prefix != "/":
-        path = path_prefix + path
+    path = f"{jobs_prefix}/jobs/{{job_id}}"
     app.add_api_route(
         path,
         route,
@@ -205,23 +261,29 @@ def _add_get_job_route(app: FastAPI, path_prefix: str, worker_fn: Callable, exec
         methods=["GET"],
         responses=responses,
         tags=opts.tags,
+        response_class=ORJSONResponse,
         response_model_exclude_none=True,
         response_model_by_alias=True,
     )
 
 def _return_job_result(el, job_id):
     h = { "job-id": JOB_URN_PREFIX + job_id }
-    if isinstance(el, IvcapResult):
+    # errors are rare - keep the success path first and straight-line;
+    # the exact-type check short-circuits the mro walk for the common
+    # case while the isinstance fallback keeps subclasses working
+    if type(el) is IvcapResult or isinstance(el, IvcapResult):
         return  Response(status_code=status.HTTP_200_OK, content=el.content, media_type=el.content_type, headers=h)
     elif isinstance(el, ExecutionError):
-        if el.type == ValueError:
+        # 'el.type' holds the exception's class _name_
+        if el.type == "ValueError":
             m = ErrorModel(message=el.error, code=400)
             status_code=status.HTTP_400_BAD_REQUEST
         else:
             m = ExecutionErrorModel(message=el.error, traceback=el.traceback)
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
 
-        return Response(status_code=status_code, content=m.model_dump_json(indent=2), media_type="application/json", headers=h)
+        # a prepared ORJSONResponse skips FastAPI's jsonable_encoder walk
+        return ORJSONResponse(status_code=status_code, content=m.model_dump(mode="json", by_alias=True), headers=h)
 
     msg = json.dumps({"error": f"please report unexpected internal error - unexpected result type {type(el)}"})
     return  Response(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content=msg, media_type="application/json", headers=h)
@@ -243,18 +305,14 @@ def _add_get_tool_def_route(app: FastAPI, path_prefix: str, worker_fn: Callable,
         summary="Returns the description of this tool. Primarily used by agents.",
         methods=["GET"],
         tags=opts.tags,
+        response_class=ORJSONResponse,
         response_model_exclude_none=True,
         response_model_by_alias=True,
     )
 
 
-def _return_try_later(job_id: str, path_prefix: str, opts: ToolOptions):
-    location = f"/jobs/{job_id}"
-    if path_prefix != "/":
-        location = path_prefix + location
-    headers = {
-        "Location": location,
-        "Retry-Later": f"{opts.refresh_interval}",
-        "Ivcap-Self-Report-Result": "true"
-    }
+def _return_try_later(job_id: str, jobs_prefix: str, try_later_headers: Dict[str, str]):
+    location = f"{jobs_prefix}/jobs/{job_id}"
+    headers = try_later_headers.copy()
+    headers["Location"] = location
     return Response(status_code=status.HTTP_204_NO_CONTENT, headers=headers)
@@ -56,7 +56,7 @@ def get_job_id() -> Optional[EventReporter]:
 
 class Executor(Generic[T]):
     """
-    A generic class that executes a function in a thread pool and returns the result via an asyncio Queue.
+    A generic class that executes a function in a thread pool and delivers the result via an asyncio Future.
     The generic type T represents the return type of the function.
     """
 
@@ -86,7 +86,8 @@ class Executor(Generic[T]):
         func: Callable[..., T],
         *,
         opts: Optional[ExecutorOpts],
-        context: Optional[JobContext] = None
+        context: Optional[JobContext] = None,
+        output_model: Optional[type] = None,
     ):
         """
         Initialize the Executor with a function and an optional thread pool.
@@ -97,11 +98,16 @@ class Executor(Generic[T]):
              - job_cache_size: Optional size of job cache. Defaults to 1000
              - job_cache_ttl: Optional TTL of job entries in the job cache. Defaults to 600 sec
              - max_workers: Optional size of thread pool to use. If None, a new thread pool will be created for each execution.
+            output_model: The type returned by `func`. A plain argument as
+              subscripting the class (`Executor[model]`) would allocate a
+              new typing alias per tool registration.
         """
         self.func = func
+        self.output_model = output_model
         if opts is None:
             opts = ExecutorOpts()
         self.job_cache = TTLCache(maxsize=opts.job_cache_size, ttl=opts.job_cache_ttl)
+        self._pending_futures = {} # job_id -> future of a still running job
         self.thread_pool = None
         if opts.max_workers:
             self.thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=opts.max_workers)
@@ -121,9 +127,9 @@ class Executor(Generic[T]):
             else:
                 raise Exception(f"unexpected function parameter '{k}'")
 
-    async def execute(self, param: Any, job_id: str, req: Request, report_result=True) -> asyncio.Queue[Union[T, ExecutionError]]:
+    async def execute(self, param: Any, job_id: str, req: Request, report_result=True) -> "asyncio.Future[Union[T, ExecutionError]]":
         """
-        Execute the function with the given parameter in a thread and return a queue with the result.
+        Execute the function with the given parameter in a thread and return a future for the result.
 
         Args:
             param: Any The parameter to pass to the function
@@ -131,14 +137,22 @@ class Executor(Generic[T]):
             req: Request FastAPI's request object
 
         Returns:
-            An asyncio Queue that will contain either the result of type T or an ExecutionError
+            An asyncio Future that will resolve to either the result of type T or an ExecutionError
         """
-        result_queue: asyncio.Queue[Union[T, ExecutionError]] = asyncio.Queue()
         event_loop = asyncio.get_running_loop()
+        result_future: asyncio.Future[Union[T, ExecutionError]] = event_loop.create_future()
         self.job_cache[job_id] = None
+        self._pending_futures[job_id] = result_future
+
+        def _set_result(result):
+            # The caller may have stopped waiting (and cancelled the
+            # future) long before the job finished
+            if not result_future.done():
+                result_future.set_result(result)
+            self._pending_futures.pop(job_id, None)
 
         def _process_result(result):
-            """Verify the result, add it to the queue, and report it to IVCAP."""
+            """Verify the result, resolve the future, and report it to IVCAP."""
             try:
                 result = verify_result(result, job_id, logger)
             except Exception as e:
@@ -147,14 +161,17 @@ class Executor(Generic[T]):
                     type=type(e).__name__,
                     traceback=traceback.format_exc()
                 )
-                logger.warning(f"job {job_id} failed - {result.error}")
+                logger.warning("job %s failed - %s", job_id, result.error)
             finally:
                 self.job_cache[job_id] = result
-                logger.info(f"job {job_id} finished, sending result message")
-                asyncio.run_coroutine_threadsafe(
-                    result_queue.put(result),
-                    event_loop,
-                )
+                logger.info("job %s finished, sending result message", job_id)
+                try:
+                    event_loop.call_soon_threadsafe(_set_result, result)
+                except RuntimeError:
+                    # the loop the request came in on is gone (e.g. closed
+                    # after the response was sent) - nobody is waiting on
+                    # the future, but the entry must not leak
+                    self._pending_futures.pop(job_id, None)
                 if report_result:
                     push_result(result, job_id)
                 self.__class__._active_jobs.discard(job_id)
@@ -213,7 +230,7 @@ class Executor(Generic[T]):
                     raise
                 except Exception as ex:
                     span.record_exception(ex)
-                    logger.error(f"while executing {job_id} - {type(ex).__name__}: {ex}")
+                    logger.error("while executing %s - %s: %s", job_id, type(ex).__name__, ex)
                     res = ExecutionError(
                         error=str(ex),
                         type=type(ex).__name__,
@@ -225,7 +242,7 @@ class Executor(Generic[T]):
                 try:
                     _process_result(res)
                 except Exception as ex:
-                    logger.error(f"while delivering result fo {job_id} - {ex}")
+                    logger.error("while delivering result fo %s - %s", job_id, ex)
 
                 job_context.set(JobContext())
 
@@ -239,7 +256,7 @@ class Executor(Generic[T]):
         # If we created a new pool, we should clean it up when done
         if self.thread_pool is None:
             future.add_done_callback(lambda _: use_pool.shutdown(wait=False))
-        return result_queue
+        return result_future
 
     def lookup_job(self, job_id: str) -> Union[T, ExecutionError, None]:
         """Return the result of a job
@@ -254,3 +271,22 @@ class Executor(Generic[T]):
             KeyError: Unknown job - may have already expired
         """
         return self.job_cache[job_id]
+
+    def lookup_job_future(self, job_id: str) -> Union[T, ExecutionError, "asyncio.Future", None]:
+        """Return the result of a job, or its pending future if still running
+
+        Args:
+            job_id (str): The id of the job requested
+
+        Returns:
+            The job's result, the future it will be delivered through if
+            the job is still in progress, or 'None' if in progress but no
+            future is held (e.g. the cache entry outlived the request loop)
+
+        Raises:
+            KeyError: Unknown job - may have already expired
+        """
+        result = self.job_cache[job_id]
+        if result is None:
+            return self._pending_futures.get(job_id)
+        return result
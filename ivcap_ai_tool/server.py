@@ -6,6 +6,7 @@
 import argparse
 from logging import Logger
 from signal import SIGTERM, signal
+from time import perf_counter
 from typing import Any, Callable, Dict, Optional
 from fastapi import FastAPI, Request, Response
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
@@ -19,18 +20,44 @@ from ivcap_service import (
 )
 
 from .executor import Executor, get_job_context
-from .version import get_version
-from .utils import find_first
+from .version import __version__, get_version
 #from .context import set_context, otel_instrument
 from .builder import tools
 
 # shutdown pod cracefully
 signal(SIGTERM, lambda _1, _2: sys.exit(0))
 
+# Guards against instrumenting the (module-wide) app twice when
+# start_tool_server is entered again in the same process
+_OTEL_INSTRUMENTED = False
+
 _app = FastAPI(
     docs_url="/api",
 )
 
+class TimingMiddleware:
+    """Report request processing time in an 'X-Response-Time' header.
+
+    Implemented as a pure ASGI middleware to avoid the per-request
+    Request construction and extra task overhead of Starlette's
+    BaseHTTPMiddleware."""
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                elapsed = perf_counter() - start
+                message["headers"].append((b"x-response-time", f"{elapsed:.6f}".encode()))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
 def get_fast_app() -> FastAPI:
     """Get the FastAPI app instance.
 
@@ -107,8 +134,7 @@ def start_tool_server(
     logger.info(f"{title} - {os.getenv('VERSION')} - v{get_version()}|v{get_service_version()}")
 
     # Check for '_healtz' service
-    healtz = find_first(app.routes, lambda r: r.path == "/_healtz")
-    if healtz is None:
+    if not any(getattr(r, "path", None) == "/_healtz" for r in app.routes):
         @app.get("/_healtz", tags=["System"])
         def healtz():
             return {"version": os.environ.get("VERSION", "???")}
@@ -128,15 +154,18 @@ def start_tool_server(
         return jctxt
     set_context(get_context)
 
-    otel_instrument(with_telemetry, lambda _: FastAPIInstrumentor.instrument_app(app), logger)
+    global _OTEL_INSTRUMENTED
+    if not _OTEL_INSTRUMENTED:
+        otel_instrument(with_telemetry, lambda _: FastAPIInstrumentor.instrument_app(app), logger)
+        _OTEL_INSTRUMENTED = True
 
     async def _add_version(request: Request, call_next) -> Response:
-        from .version import __version__
         resp = await call_next(request)
         resp.headers["Ivcap-AI-Tool-Version"] = __version__
         return resp
 
     app.middleware("http")(_add_version)
+    app.add_middleware(TimingMiddleware)
 
     if run_opts is None:
         run_opts = {}
@@ -3,17 +3,12 @@
 # Use of this source code is governed by a BSD-style license that can be
 # found in the LICENSE file. See the AUTHORS file for names of contributors.
 #
+from importlib.metadata import version, PackageNotFoundError
 
-__version__ = "???"
-try:  # Python > 3.8+
-    from importlib_metadata import version
+try:
     __version__ = version("ivcap_ai_tool")
-except ImportError:
-    try:
-        import pkg_resources
-        __version__ = pkg_resources.get_distribution('ivcap_ai_tool').version
-    except Exception:
-        pass
+except PackageNotFoundError:  # not installed (e.g. run from a checkout)
+    __version__ = "???"
 
 def get_version():
-    return __version__
\ No newline at end of file
+    return __version__